@@ -83,12 +83,17 @@ if __name__ == "__main__":
     max_input_length = 500
     
     # Training parameters
+    # Experimental, opt-in: XLA auto-clustering of the training graph
+    use_xla_jit = False
     batch_size = 100
     batches_per_epoch = 10
     epochs = 100
     embedding_trainable = False
     build_own_vocab = False
     use_google_word2vec = True
+    # Keep tokenized training descriptions in memory after the first pass over the file.
+    # Only pays off if epochs * batches_per_epoch * batch_size exceeds the number of training rows
+    cache_training_data = False
     
     loss_ = 'categorical_crossentropy'
     optimizer_ = 'adam'
@@ -162,6 +167,15 @@ if __name__ == "__main__":
     # Fix random seed for reproducibility
     np.random.seed(70) # Chosen by random.org, guaranteed to be random 
     
+    # Has to happen before the model is built or loaded, so it ends up in the right session.
+    # XLA requires static shapes, which we have since inputs are padded to max_input_length.
+    # TF builds without XLA silently ignore this.
+    if use_xla_jit:
+        import tensorflow as tf
+        config = tf.ConfigProto()
+        config.graph_options.optimizer_options.global_jit_level = tf.OptimizerOptions.ON_1
+        K.set_session(tf.Session(config=config))
+    
     embedding_matrix = vocab_model.syn0
     vocab_dict = {word: vocab_model.vocab[word].index for word in vocab_model.vocab.keys()}
     vocab_size = len(vocab_dict)
@@ -197,7 +211,8 @@ if __name__ == "__main__":
         training_start_time = datetime.datetime.now()
         print('{0}: Starting training at epoch {1}/{2}'.format(training_start_time, initial_epoch, epochs))
         
-        train_generator = create_batch_generator(train_path, vocab_dict, num_classes, max_input_length, batch_size)
+        train_generator = create_batch_generator(train_path, vocab_dict, num_classes, max_input_length, batch_size,
+                                                 cache=cache_training_data)
         model.fit_generator(train_generator, batches_per_epoch, epochs, callbacks=_callbacks, initial_epoch=initial_epoch)
         
         training_end_time = datetime.datetime.now()
@@ -41,7 +41,7 @@ def plot_with_labels(low_dim_embs, labels, filename=None, text_alpha=0.8, **plot
 def tsne_plot(data_points, filename=None):
     tsne = TSNE(perplexity=30, n_components=2, init='pca', n_iter=5000, random_state=2157)
     low_dim_embs = tsne.fit_transform(data_points)
-    plt.scatter(low_dim_embeds[:,0], low_dim_embeds[:,1])
+    plt.scatter(low_dim_embs[:,0], low_dim_embs[:,1])
         
     if filename is not None:
         plt.title(filename.split('.')[0])
@@ -25,7 +25,8 @@ def create_training_batch(generator, num_classes, max_input_length, max_batch_si
         # Change the class numbering to 0-based
         _class = int(info_dict['class']) - 1
         
-        text_data.append(info_dict['word_list'])
+        if return_raw_text:
+            text_data.append(info_dict['word_list'])
         X_.append(seq_data)
         y_.append(_class)
         
@@ -56,23 +57,40 @@ def basic_desc_generator(input_path):
     for cur_dict in dict_generator:
         yield cur_dict['word_list']
     
-def create_desc_generator(input_path, word2id, indefinite=False, min_word_count=10):
+def create_desc_generator(input_path, word2id, indefinite=False, min_word_count=10, cache=False, cache_raw_text=False):
     _finished = False
+    # Tokenized descriptions from the first full pass, if caching
+    _cached_dicts = None
     while not _finished:
-        dict_generator = desc_dict_generator(input_path)
-        for cur_dict in dict_generator:
-            word_list = cur_dict['word_list']
-            int_word_list = [word2id[w] for w in word_list if w in word2id]
-            if len(int_word_list) < min_word_count:
-                continue
-            cur_dict['int_word_list'] = int_word_list
-            yield cur_dict
+        if _cached_dicts is not None:
+            # The file is read in the same order every pass, so replaying the cache is equivalent
+            for cur_dict in _cached_dicts:
+                yield cur_dict
+        else:
+            cur_cache = [] if cache else None
+            dict_generator = desc_dict_generator(input_path)
+            for cur_dict in dict_generator:
+                word_list = cur_dict['word_list']
+                int_word_list = [word2id[w] for w in word_list if w in word2id]
+                if len(int_word_list) < min_word_count:
+                    continue
+                cur_dict['int_word_list'] = int_word_list
+                if cur_cache is not None:
+                    # Only keep the fields needed for batching, and store the word ids compactly
+                    cached_dict = {'class': cur_dict['class'],
+                                   'int_word_list': np.array(int_word_list, dtype=np.int32)}
+                    if cache_raw_text:
+                        cached_dict['word_list'] = word_list
+                    cur_cache.append(cached_dict)
+                yield cur_dict
+            _cached_dicts = cur_cache
         
         _finished = not indefinite
         
         
-def create_batch_generator(input_path, word2id, num_classes, max_input_length, batch_size, return_raw_text=False):
-    desc_generator = create_desc_generator(input_path, word2id, indefinite=True)
+def create_batch_generator(input_path, word2id, num_classes, max_input_length, batch_size, return_raw_text=False, cache=False):
+    desc_generator = create_desc_generator(input_path, word2id, indefinite=True, cache=cache,
+                                           cache_raw_text=return_raw_text)
     while True:
         cur_batch = create_training_batch(desc_generator, num_classes, max_input_length, batch_size, return_raw_text=return_raw_text)
         yield cur_batch
\ No newline at end of file